@@ -1,6 +1,30 @@
 import duckdb
 import os
 
+def build_product_dim(conn):
+    """
+    Build the product dimension: per-product attributes and price-history
+    aggregates, one row per product. Rebuilt on every run.
+    """
+    print("Creating product_dim table...")
+    conn.execute("""
+        CREATE OR REPLACE TABLE product_dim AS
+        SELECT
+            product_id,
+            MODE(category_info_main) as category_info_main,
+            MODE(category_info_sub) as category_info_sub,
+            MODE(product_attributes_size) as size,
+            MODE(product_attributes_color) as color,
+            MODE(product_attributes_material) as material,
+            MAX(product_attributes_warranty_months) as warranty_months,
+            AVG(price_history_avg_price) as historical_avg_price,
+            MIN(price_history_min_price) as historical_min_price,
+            MAX(price_history_max_price) as historical_max_price,
+            MAX(price_history_max_discount) as max_discount_offered
+        FROM ecommerce
+        GROUP BY product_id;
+    """)
+
 def initialize_duckdb():
     # Create a connection to a new or existing DuckDB database
     print("Initializing DuckDB database...")
@@ -23,6 +47,9 @@ def initialize_duckdb():
         conn.execute("CREATE INDEX IF NOT EXISTS idx_customer ON ecommerce(customer_id);")
         conn.execute("CREATE INDEX IF NOT EXISTS idx_timestamp ON ecommerce(timestamp);")
         conn.execute("CREATE INDEX IF NOT EXISTS idx_category ON ecommerce(category_info_main, category_info_sub);")
+
+        # Product dimension; sales aggregates are views over ecommerce (see duckdb_views.py)
+        build_product_dim(conn)
         
         # Verify the data
         result = conn.execute("SELECT COUNT(*) as total_rows FROM ecommerce").fetchone()
@@ -22,28 +22,39 @@ def create_analytical_views():
         ORDER BY 1;
         """)
 
-        # 2. Create view for product performance
-        print("Creating product_performance view...")
+        # 2. Create views for product performance
+        # Sales aggregate keyed only on product_id; attributes come from product_dim
+        print("Creating product_sales view...")
         conn.execute("""
-        CREATE OR REPLACE VIEW product_performance AS
+        CREATE OR REPLACE VIEW product_sales AS
         SELECT 
             product_id,
-            category_info_main,
-            category_info_sub,
             COUNT(*) as total_sales,
             SUM(quantity) as units_sold,
             AVG(base_price) as avg_price,
             AVG(review_score) as avg_rating,
-            COUNT(CASE WHEN review_score IS NOT NULL THEN 1 END) as review_count,
-            price_history_avg_price as historical_avg_price,
-            price_history_max_discount as max_discount_offered
+            COUNT(review_score) as review_count
         FROM ecommerce
-        GROUP BY 
-            product_id, 
-            category_info_main, 
-            category_info_sub,
-            price_history_avg_price,
-            price_history_max_discount;
+        GROUP BY product_id;
+        """)
+
+        # LEFT JOIN keeps products appended since product_dim was last built
+        print("Creating product_performance view...")
+        conn.execute("""
+        CREATE OR REPLACE VIEW product_performance AS
+        SELECT 
+            s.product_id,
+            d.category_info_main,
+            d.category_info_sub,
+            s.total_sales,
+            s.units_sold,
+            s.avg_price,
+            s.avg_rating,
+            s.review_count,
+            d.historical_avg_price,
+            d.max_discount_offered
+        FROM product_sales s
+        LEFT JOIN product_dim d USING (product_id);
         """)
 
         # 3. Create view for customer segmentation
@@ -130,6 +141,7 @@ def create_analytical_views():
             FROM duckdb_views() 
             WHERE view_name IN (
                 'daily_sales_metrics',
+                'product_sales',
                 'product_performance',
                 'customer_segments',
                 'product_features_analysis',